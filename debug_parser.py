@@ -9,7 +9,7 @@ Usage:
     python3 debug_parser.py  (pour mode interactif)
 """
 
-import json
+import orjson
 import sys
 from datetime import datetime
 from tidsreg_client import TidsregClient
@@ -47,26 +47,23 @@ def main():
 
     # Get registered hours
     print(f"\n📊 Récupération des heures pour {date}...")
-    result = client.get_registered_hours(date)
+    result = client.get_registered_hours(date, include_raw=True)
 
     if "error" in result:
         print(f"❌ Erreur: {result['error']}")
         return
 
-    # Save HTML
-    hours_date = client._convert_date_to_hours_format(date)
-    url = f"{client.BASE_URL}/Hours/{hours_date}"
-    response = client.session.get(url, allow_redirects=True)
-
+    # Save HTML (the page already downloaded by get_registered_hours)
+    html = result.pop("_raw_html", "")
     html_filename = f"debug_html_{date.replace('-', '')}.html"
     with open(html_filename, 'w', encoding='utf-8') as f:
-        f.write(response.text)
+        f.write(html)
     print(f"💾 HTML sauvegardé: {html_filename}")
 
     # Save parsed data
     json_filename = f"debug_parsed_{date.replace('-', '')}.json"
-    with open(json_filename, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    with open(json_filename, 'wb') as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     print(f"💾 Données parsées sauvegardées: {json_filename}")
 
     # Display summary
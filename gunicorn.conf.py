@@ -0,0 +1,43 @@
+"""
+Gunicorn configuration for the Tidsreg HTTP server.
+
+Usage:
+    gunicorn -c gunicorn.conf.py
+"""
+
+import os
+
+bind = "0.0.0.0:8000"
+
+# Threaded workers overlap the blocking upstream calls made by TidsregClient
+# instead of serializing them behind a single request. Set
+# GUNICORN_WORKER_CLASS=gevent to serve from greenlets instead; the app is
+# then loaded through wsgi.py, which monkey-patches before anything else.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+
+if worker_class == "gevent":
+    wsgi_app = "wsgi:app"
+    worker_connections = 1000
+else:
+    wsgi_app = "http_server:app"
+    threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# Every caller sends the X-Auth-Ticket returned by its login, which any
+# worker can resume, so the worker count only trades memory for parallelism.
+workers = int(os.environ.get("GUNICORN_WORKERS", "1"))
+
+# Import the app in the master so workers fork with it already loaded and
+# share its read-only pages copy-on-write.
+preload_app = True
+
+# Recycle workers periodically so long-lived sessions and caches cannot grow
+# the heap without bound. A recycled worker starts with an empty session
+# pool and resumes each caller's session from its X-Auth-Ticket.
+max_requests = 1000
+max_requests_jitter = 200
+
+# Upstream calls are bounded by TidsregClient.TIMEOUT; leave headroom for
+# the few that chain several of them
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
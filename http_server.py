@@ -6,8 +6,16 @@ Can be exposed via localtunnel for use with ChatGPT Desktop or other HTTP client
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import functools
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+import orjson
 from tidsreg_client import TidsregClient
 
 # Configure logging
@@ -17,12 +25,174 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (C encoder, UTF-8 output)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
-# Global Tidsreg client instance to maintain session
-client = TidsregClient()
+
+class ClientPool:
+    """
+    Least-recently-used pool of TidsregClient instances, one per AuthTicket.
+
+    Each authenticated user gets a client (and so a cookie jar and keep-alive
+    pool) of their own instead of sharing one global session.
+    """
+
+    # Tickets Tidsreg did not accept are answered without asking again for
+    # this many seconds; at most REJECTED_SIZE of them are remembered
+    REJECTED_TTL = 30.0
+    REJECTED_SIZE = 256
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._clients = OrderedDict()
+        # AuthTicket -> time it was rejected, oldest first
+        self._rejected = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, tidsreg_client: TidsregClient) -> None:
+        """Register a logged-in client under its AuthTicket."""
+        with self._lock:
+            auth_ticket = tidsreg_client.get_auth_ticket()
+            self._rejected.pop(auth_ticket, None)
+            self._store(auth_ticket, tidsreg_client)
+
+    def get(self, auth_ticket: str) -> Optional[TidsregClient]:
+        """
+        Return the client for an AuthTicket, resuming the session if it is not pooled.
+
+        Only tickets that Tidsreg accepts are pooled, so unknown tickets can't
+        push real sessions out. A ticket it does not accept gives None, and is
+        remembered for a short while so that a stale cookie does not cost a
+        new session and a round trip on every request.
+        """
+        with self._lock:
+            tidsreg_client = self._clients.get(auth_ticket)
+            if tidsreg_client is not None:
+                self._clients.move_to_end(auth_ticket)
+                return tidsreg_client
+
+            rejected_at = self._rejected.get(auth_ticket)
+            if rejected_at is not None:
+                if time.monotonic() - rejected_at < self.REJECTED_TTL:
+                    return None
+                del self._rejected[auth_ticket]
+
+        # Checked outside the lock: it is a round trip to Tidsreg
+        tidsreg_client = TidsregClient()
+        if not tidsreg_client.use_auth_ticket(auth_ticket):
+            tidsreg_client.session.close()
+            with self._lock:
+                self._rejected[auth_ticket] = time.monotonic()
+                self._rejected.move_to_end(auth_ticket)
+                while len(self._rejected) > self.REJECTED_SIZE:
+                    self._rejected.popitem(last=False)
+            return None
+
+        with self._lock:
+            # Another request may have resumed the same session meanwhile
+            pooled = self._clients.get(auth_ticket)
+            if pooled is not None:
+                self._clients.move_to_end(auth_ticket)
+                tidsreg_client.session.close()
+                return pooled
+
+            self._store(auth_ticket, tidsreg_client)
+            return tidsreg_client
+
+    def _store(self, auth_ticket: str, tidsreg_client: TidsregClient) -> None:
+        self._clients[auth_ticket] = tidsreg_client
+        self._clients.move_to_end(auth_ticket)
+
+        # Release the sockets of evicted sessions right away
+        while len(self._clients) > self.maxsize:
+            _, evicted = self._clients.popitem(last=False)
+            evicted.session.close()
+
+
+client_pool = ClientPool()
+
+# Answer to requests that do not carry a session Tidsreg accepts
+NOT_AUTHENTICATED = {
+    "error": "Not authenticated: log in with POST /api/login and send the returned "
+             "auth_ticket as the X-Auth-Ticket header",
+    "status": 401
+}
+
+
+def get_client() -> Optional[TidsregClient]:
+    """
+    Return the Tidsreg client for the current request.
+
+    Callers identify their session with the AuthTicket returned by /api/login,
+    sent either as an `X-Auth-Ticket` header or as the `AuthTicket` cookie.
+    There is no shared session: requests without a valid ticket get None.
+    """
+    auth_ticket = request.headers.get('X-Auth-Ticket') or request.cookies.get('AuthTicket')
+    if not auth_ticket:
+        return None
+
+    return client_pool.get(auth_ticket)
+
+
+def tidsreg_route(method_name, required=(), optional=()):
+    """
+    Turn a view into a thin GET wrapper around a TidsregClient method.
+
+    The query parameters named in `required` and `optional` are passed as
+    keyword arguments of the same name. The decorated function only provides
+    the endpoint name and documentation.
+
+    Args:
+        method_name: Name of the TidsregClient method to call
+        required: Query parameters that must be present and non-empty
+        optional: Query parameters passed through when present
+    """
+    method = getattr(TidsregClient, method_name)
+    keys = tuple(required) + tuple(optional)
+    missing_error = {"error": f"Missing {' or '.join(required)} parameter"}
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper():
+            try:
+                args = request.args
+                kwargs = {key: args.get(key) for key in keys}
+
+                if not all(kwargs[key] for key in required):
+                    return jsonify(missing_error), 400
+
+                tidsreg_client = get_client()
+                if tidsreg_client is None:
+                    return jsonify(NOT_AUTHENTICATED), 401
+
+                result = method(tidsreg_client, **kwargs)
+
+                if 'error' in result:
+                    status_code = result.get('status', 500)
+                    return jsonify(result), status_code
+
+                return jsonify(result)
+
+            except Exception as e:
+                logger.exception("%s error", view.__name__)
+                return jsonify({"error": str(e)}), 500
+
+        return wrapper
+
+    return decorator
 
 
 @app.route('/health', methods=['GET'])
@@ -30,7 +200,7 @@ def health():
     """Health check endpoint."""
     return jsonify({
         "status": "ok",
-        "authenticated": client.is_authenticated()
+        "authenticated": get_client() is not None
     })
 
 
@@ -50,7 +220,9 @@ def login():
         if not data or 'username' not in data or 'password' not in data:
             return jsonify({"error": "Missing username or password"}), 400
 
-        result = client.login(
+        # Every login gets a session of its own
+        new_client = TidsregClient()
+        result = new_client.login(
             username=data['username'],
             password=data['password']
         )
@@ -58,7 +230,12 @@ def login():
         if 'error' in result:
             return jsonify(result), 401
 
-        return jsonify(result)
+        client_pool.add(new_client)
+
+        auth_ticket = new_client.get_auth_ticket()
+        response = jsonify({**result, "auth_ticket": auth_ticket})
+        response.set_cookie('AuthTicket', auth_ticket, httponly=True, samesite='Lax')
+        return response
 
     except Exception as e:
         logger.exception("Login error")
@@ -66,6 +243,7 @@ def login():
 
 
 @app.route('/api/customers', methods=['GET'])
+@tidsreg_route('list_customers', optional=('date',))
 def list_customers():
     """
     List all available customers.
@@ -73,22 +251,10 @@ def list_customers():
     Query parameters:
     - date: Date in format YYYY-MM-DD (optional)
     """
-    try:
-        date = request.args.get('date')
-        result = client.list_customers(date=date)
-
-        if 'error' in result:
-            status_code = result.get('status', 500)
-            return jsonify(result), status_code
-
-        return jsonify(result)
-
-    except Exception as e:
-        logger.exception("List customers error")
-        return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/projects', methods=['GET'])
+@tidsreg_route('list_projects', required=('customerId', 'date'))
 def list_projects():
     """
     List projects for a customer.
@@ -97,30 +263,10 @@ def list_projects():
     - customerId: Customer ID (required)
     - date: Date in format YYYY-MM-DD (required)
     """
-    try:
-        customer_id = request.args.get('customerId')
-        date = request.args.get('date')
-
-        if not customer_id or not date:
-            return jsonify({"error": "Missing customerId or date parameter"}), 400
-
-        result = client.list_projects(
-            customerId=customer_id,
-            date=date
-        )
-
-        if 'error' in result:
-            status_code = result.get('status', 500)
-            return jsonify(result), status_code
-
-        return jsonify(result)
-
-    except Exception as e:
-        logger.exception("List projects error")
-        return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/phases', methods=['GET'])
+@tidsreg_route('list_phases', required=('projectId', 'date'))
 def list_phases():
     """
     List phases for a project.
@@ -129,30 +275,10 @@ def list_phases():
     - projectId: Project ID (required)
     - date: Date in format YYYY-MM-DD (required)
     """
-    try:
-        project_id = request.args.get('projectId')
-        date = request.args.get('date')
-
-        if not project_id or not date:
-            return jsonify({"error": "Missing projectId or date parameter"}), 400
-
-        result = client.list_phases(
-            projectId=project_id,
-            date=date
-        )
-
-        if 'error' in result:
-            status_code = result.get('status', 500)
-            return jsonify(result), status_code
-
-        return jsonify(result)
-
-    except Exception as e:
-        logger.exception("List phases error")
-        return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/activities', methods=['GET'])
+@tidsreg_route('list_activities', required=('phaseId', 'date'))
 def list_activities():
     """
     List activities for a phase.
@@ -161,30 +287,10 @@ def list_activities():
     - phaseId: Phase ID (required)
     - date: Date in format YYYY-MM-DD (required)
     """
-    try:
-        phase_id = request.args.get('phaseId')
-        date = request.args.get('date')
-
-        if not phase_id or not date:
-            return jsonify({"error": "Missing phaseId or date parameter"}), 400
-
-        result = client.list_activities(
-            phaseId=phase_id,
-            date=date
-        )
-
-        if 'error' in result:
-            status_code = result.get('status', 500)
-            return jsonify(result), status_code
-
-        return jsonify(result)
-
-    except Exception as e:
-        logger.exception("List activities error")
-        return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/kinds', methods=['GET'])
+@tidsreg_route('list_kinds', required=('projectName', 'activityName'))
 def list_kinds():
     """
     List kinds for a project and activity.
@@ -193,27 +299,6 @@ def list_kinds():
     - projectName: Project name (required)
     - activityName: Activity name (required)
     """
-    try:
-        project_name = request.args.get('projectName')
-        activity_name = request.args.get('activityName')
-
-        if not project_name or not activity_name:
-            return jsonify({"error": "Missing projectName or activityName parameter"}), 400
-
-        result = client.list_kinds(
-            projectName=project_name,
-            activityName=activity_name
-        )
-
-        if 'error' in result:
-            status_code = result.get('status', 500)
-            return jsonify(result), status_code
-
-        return jsonify(result)
-
-    except Exception as e:
-        logger.exception("List kinds error")
-        return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/navigate', methods=['POST'])
@@ -231,7 +316,11 @@ def navigate_to_date():
         if not data or 'date' not in data:
             return jsonify({"error": "Missing date parameter"}), 400
 
-        result = client.navigate_to_date(date=data['date'])
+        tidsreg_client = get_client()
+        if tidsreg_client is None:
+            return jsonify(NOT_AUTHENTICATED), 401
+
+        result = tidsreg_client.navigate_to_date(date=data['date'])
 
         if 'error' in result:
             status_code = result.get('status', 500)
@@ -273,9 +362,12 @@ def week_operations():
             navigate = data.get('navigate', False)
 
         if navigate:
-            result = client.navigate_to_week(year=year, week=week)
+            tidsreg_client = get_client()
+            if tidsreg_client is None:
+                return jsonify(NOT_AUTHENTICATED), 401
+            result = tidsreg_client.navigate_to_week(year=year, week=week)
         else:
-            result = client.get_week_dates(year=year, week=week)
+            result = TidsregClient.get_week_dates(year=year, week=week)
 
         if 'error' in result:
             status_code = result.get('status', 500)
@@ -289,6 +381,7 @@ def week_operations():
 
 
 @app.route('/api/hours', methods=['GET'])
+@tidsreg_route('get_registered_hours', required=('date',))
 def get_registered_hours():
     """
     Retrieve registered hours for a specific date/week.
@@ -296,23 +389,17 @@ def get_registered_hours():
     Query parameters:
     - date: Date in format YYYY-MM-DD (required)
     """
-    try:
-        date = request.args.get('date')
 
-        if not date:
-            return jsonify({"error": "Missing date parameter"}), 400
-
-        result = client.get_registered_hours(date=date)
-
-        if 'error' in result:
-            status_code = result.get('status', 500)
-            return jsonify(result), status_code
 
-        return jsonify(result)
+@app.route('/api/hours/week', methods=['GET'])
+@tidsreg_route('get_registered_hours_week', required=('date',))
+def get_registered_hours_week():
+    """
+    Retrieve registered hours for every day of the week containing a date.
 
-    except Exception as e:
-        logger.exception("Get registered hours error")
-        return jsonify({"error": str(e)}), 500
+    Query parameters:
+    - date: Any date of the week in format YYYY-MM-DD (required)
+    """
 
 
 @app.route('/api/tools', methods=['GET'])
@@ -369,6 +456,15 @@ def list_tools():
                 "date": "YYYY-MM-DD"
             }
         },
+        {
+            "name": "get_registered_hours_week",
+            "method": "GET",
+            "endpoint": "/api/hours/week",
+            "description": "Retrieve registered hours for every day of a week",
+            "params": {
+                "date": "YYYY-MM-DD (any day of the week)"
+            }
+        },
         {
             "name": "list_projects",
             "method": "GET",
@@ -428,7 +524,7 @@ def internal_error(error):
 
 if __name__ == '__main__':
     port = 8000
-    logger.info(f"Starting Tidsreg HTTP Server on port {port}")
+    logger.info("Starting Tidsreg HTTP Server on port %s", port)
     logger.info("Available endpoints:")
     logger.info("  POST /api/login")
     logger.info("  GET  /api/customers")
@@ -436,6 +532,7 @@ if __name__ == '__main__':
     logger.info("  GET  /api/week")
     logger.info("  POST /api/week")
     logger.info("  GET  /api/hours")
+    logger.info("  GET  /api/hours/week")
     logger.info("  GET  /api/projects")
     logger.info("  GET  /api/phases")
     logger.info("  GET  /api/activities")
@@ -443,6 +540,12 @@ if __name__ == '__main__':
     logger.info("  GET  /api/tools")
     logger.info("  GET  /health")
     logger.info("")
-    logger.info(f"To expose via localtunnel: lt --port {port}")
-
-    app.run(host='0.0.0.0', port=port, debug=False)
+    logger.info("To expose via localtunnel: lt --port %s", port)
+
+    # Hand over to gunicorn (see gunicorn.conf.py) instead of the dev server
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    os.execvp("gunicorn", [
+        "gunicorn",
+        "--chdir", base_dir,
+        "-c", os.path.join(base_dir, "gunicorn.conf.py")
+    ])
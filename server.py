@@ -4,9 +4,10 @@ Tidsreg MCP Server
 Implements the Model Context Protocol (JSON-RPC 2.0) for Tidsreg integration.
 """
 
+import os
 import sys
-import json
 import logging
+import orjson
 from typing import Dict, Any, Optional
 from tidsreg_client import TidsregClient
 
@@ -18,8 +19,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global Tidsreg client instance to maintain session across requests
-client = TidsregClient()
+# Global Tidsreg client instance to maintain session across requests. With
+# TIDSREG_COOKIE_FILE set, the session is kept on disk between server starts.
+client = TidsregClient(cookie_path=os.environ.get("TIDSREG_COOKIE_FILE"))
+
+# Tool name -> (required arguments, optional arguments). Each tool is served
+# by the TidsregClient method of the same name, called with keyword arguments.
+TOOL_ARGUMENTS = {
+    "login": (("username", "password"), ()),
+    "navigate_to_date": (("date",), ()),
+    "navigate_to_week": ((), ("year", "week")),
+    "get_week_dates": ((), ("year", "week")),
+    "list_customers": ((), ("date",)),
+    "list_projects": (("customerId", "date"), ()),
+    "list_phases": (("projectId", "date"), ()),
+    "prefetch_project": (("customerId", "date"), ()),
+    "list_activities": (("phaseId", "date"), ()),
+    "list_kinds": (("projectName", "activityName"), ()),
+    "get_registered_hours": (("date",), ()),
+    "get_registered_hours_week": (("date",), ())
+}
 
 
 def get_tool_definitions() -> list:
@@ -140,6 +159,24 @@ def get_tool_definitions() -> list:
                 "required": ["projectId", "date"]
             }
         },
+        {
+            "name": "prefetch_project",
+            "description": "Retrieve the projects of a customer together with the phases of every project in a single call",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "customerId": {
+                        "type": "string",
+                        "description": "The customer ID"
+                    },
+                    "date": {
+                        "type": "string",
+                        "description": "Date in format YYYY-MM-DD"
+                    }
+                },
+                "required": ["customerId", "date"]
+            }
+        },
         {
             "name": "list_activities",
             "description": "Retrieve the list of activities for a specific phase",
@@ -189,6 +226,20 @@ def get_tool_definitions() -> list:
                 },
                 "required": ["date"]
             }
+        },
+        {
+            "name": "get_registered_hours_week",
+            "description": "Retrieve registered hours for every day of a week (one download of the Hours page) with per-day totals and warnings",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "date": {
+                        "type": "string",
+                        "description": "Any date of the week in format YYYY-MM-DD"
+                    }
+                },
+                "required": ["date"]
+            }
         }
     ]
 
@@ -245,74 +296,36 @@ def handle_tools_call(params: Dict[str, Any]) -> Dict[str, Any]:
     tool_name = params.get("name")
     arguments = params.get("arguments", {})
 
-    logger.info(f"Calling tool: {tool_name} with arguments: {arguments}")
+    logger.info("Calling tool: %s with arguments: %s", tool_name, arguments)
 
-    # Route to appropriate client method
+    spec = TOOL_ARGUMENTS.get(tool_name)
+    if spec is None:
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": orjson.dumps({"error": f"Unknown tool: {tool_name}"}).decode()
+                }
+            ],
+            "isError": True
+        }
+
+    required, optional = spec
+
+    # Route to the client method of the same name
     try:
-        if tool_name == "login":
-            result = client.login(
-                username=arguments["username"],
-                password=arguments["password"]
-            )
-        elif tool_name == "navigate_to_date":
-            result = client.navigate_to_date(
-                date=arguments["date"]
-            )
-        elif tool_name == "navigate_to_week":
-            result = client.navigate_to_week(
-                year=arguments.get("year"),
-                week=arguments.get("week")
-            )
-        elif tool_name == "get_week_dates":
-            result = client.get_week_dates(
-                year=arguments.get("year"),
-                week=arguments.get("week")
-            )
-        elif tool_name == "list_customers":
-            result = client.list_customers(
-                date=arguments.get("date")
-            )
-        elif tool_name == "list_projects":
-            result = client.list_projects(
-                customerId=arguments["customerId"],
-                date=arguments["date"]
-            )
-        elif tool_name == "list_phases":
-            result = client.list_phases(
-                projectId=arguments["projectId"],
-                date=arguments["date"]
-            )
-        elif tool_name == "list_activities":
-            result = client.list_activities(
-                phaseId=arguments["phaseId"],
-                date=arguments["date"]
-            )
-        elif tool_name == "list_kinds":
-            result = client.list_kinds(
-                projectName=arguments["projectName"],
-                activityName=arguments["activityName"]
-            )
-        elif tool_name == "get_registered_hours":
-            result = client.get_registered_hours(
-                date=arguments["date"]
-            )
-        else:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({"error": f"Unknown tool: {tool_name}"})
-                    }
-                ],
-                "isError": True
-            }
+        kwargs = {key: arguments[key] for key in required}
+        for key in optional:
+            kwargs[key] = arguments.get(key)
+
+        result = getattr(client, tool_name)(**kwargs)
 
         # Format result as MCP tool response
         return {
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(result, ensure_ascii=False)
+                    "text": orjson.dumps(result).decode()
                 }
             ]
         }
@@ -324,7 +337,7 @@ def handle_tools_call(params: Dict[str, Any]) -> Dict[str, Any]:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps({"error": error_msg})
+                    "text": orjson.dumps({"error": error_msg}).decode()
                 }
             ],
             "isError": True
@@ -336,7 +349,7 @@ def handle_tools_call(params: Dict[str, Any]) -> Dict[str, Any]:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps({"error": error_msg})
+                    "text": orjson.dumps({"error": error_msg}).decode()
                 }
             ],
             "isError": True
@@ -359,7 +372,7 @@ def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 
     # Handle notifications (no id = no response needed)
     if request_id is None:
-        logger.debug(f"Received notification: {method}")
+        logger.debug("Received notification: %s", method)
         # Notifications don't get a response
         if method == "notifications/initialized":
             logger.info("Client initialized")
@@ -389,7 +402,7 @@ def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         }
 
     except Exception as e:
-        logger.exception(f"Error handling request: {e}")
+        logger.exception("Error handling request: %s", e)
         return {
             "jsonrpc": "2.0",
             "error": {
@@ -400,43 +413,84 @@ def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         }
 
 
+def process_message(line: bytes) -> Optional[bytes]:
+    """
+    Decode one JSON-RPC message and encode its response.
+
+    Args:
+        line: Raw UTF-8 bytes of a single message
+
+    Returns:
+        Encoded JSON-RPC response, or None for notifications
+    """
+    try:
+        request = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        logger.error("Invalid JSON received: %s", e)
+        error_response = {
+            "jsonrpc": "2.0",
+            "error": {
+                "code": -32700,
+                "message": "Parse error"
+            },
+            "id": None
+        }
+        return orjson.dumps(error_response)
+
+    logger.debug("Received request: %s", request)
+
+    response = handle_request(request)
+
+    # Only send response if it's not a notification (response is not None)
+    if response is None:
+        return None
+
+    logger.debug("Sending response: %s", response)
+    return orjson.dumps(response)
+
+
 def main():
     """Main server loop - read from stdin, write to stdout."""
     logger.info("Tidsreg MCP Server starting...")
 
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    buffer = bytearray()
+
     try:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                request = json.loads(line)
-                logger.debug(f"Received request: {request}")
-
-                response = handle_request(request)
-
-                # Only send response if it's not a notification (response is not None)
-                if response is not None:
-                    logger.debug(f"Sending response: {response}")
-                    print(json.dumps(response), flush=True)
-
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON received: {e}")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32700,
-                        "message": "Parse error"
-                    },
-                    "id": None
-                }
-                print(json.dumps(error_response), flush=True)
+        # Messages are newline-delimited. Work on raw bytes: read whatever is
+        # available, answer every complete message in it, then flush once.
+        while True:
+            chunk = stdin.read1(65536)
+            if chunk:
+                buffer += chunk
+            elif buffer:
+                # EOF: treat a trailing message without newline as complete
+                buffer += b"\n"
+            else:
+                break
+
+            start = 0
+            end = buffer.find(b"\n")
+            while end != -1:
+                line = bytes(buffer[start:end]).strip()
+                start = end + 1
+
+                if line:
+                    payload = process_message(line)
+                    if payload is not None:
+                        stdout.write(payload)
+                        stdout.write(b"\n")
+
+                end = buffer.find(b"\n", start)
+
+            del buffer[:start]
+            stdout.flush()
 
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
-        logger.exception(f"Unexpected error in main loop: {e}")
+        logger.exception("Unexpected error in main loop: %s", e)
     finally:
         logger.info("Tidsreg MCP Server shutting down")
 
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Checks for the list_* result cache of TidsregClient.
+
+Run from the repository root:
+    python3 -m unittest discover tests
+"""
+
+import threading
+import time
+import unittest
+
+import requests
+
+from tidsreg_client import TidsregClient
+
+URL = TidsregClient._URL_CUSTOMERS
+TTL = TidsregClient._CACHE_TTLS[URL]
+
+
+class StubClient(TidsregClient):
+    """Client whose lookups are answered by a function instead of Tidsreg."""
+
+    CACHE_SIZE = 2
+
+    def __init__(self, answer):
+        super().__init__()
+        self.answer = answer
+        self.calls = []
+
+    def _request(self, url, params, error_prefix):
+        self.calls.append(params)
+        return self.answer(params)
+
+
+def get(client, *params):
+    return client._cached_get("list_customers", URL, params, "Failed to get customers")
+
+
+class CachedGetTest(unittest.TestCase):
+    """Hits, expiry, eviction and coalescing of _cached_get."""
+
+    def test_hit_returns_own_copy(self):
+        client = StubClient(lambda params: {"items": [1, 2]})
+
+        first = get(client)
+        first["items"].append("owner")
+        second = get(client)
+        second["items"].append("hit")
+
+        self.assertEqual(get(client), {"items": [1, 2]})
+        self.assertEqual(len(client.calls), 1)
+
+    def test_errors_not_cached(self):
+        client = StubClient(lambda params: {"error": "HTTP request failed: Bad Gateway", "status": 502})
+
+        self.assertEqual(get(client)["status"], 502)
+        self.assertEqual(get(client)["status"], 502)
+        self.assertEqual(len(client.calls), 2)
+
+    def test_ttl_expiry(self):
+        client = StubClient(lambda params: {"items": []})
+        get(client)
+
+        # Age the entry instead of waiting for it
+        key, (stored_at, encoded) = next(iter(client._cache.items()))
+        client._cache[key] = (stored_at - TTL + 1, encoded)
+        get(client)
+        self.assertEqual(len(client.calls), 1)
+
+        client._cache[key] = (stored_at - TTL, encoded)
+        get(client)
+        self.assertEqual(len(client.calls), 2)
+
+    def test_lru_eviction(self):
+        client = StubClient(lambda params: {"items": list(params)})
+        a, b, c = ("id", "a"), ("id", "b"), ("id", "c")
+
+        get(client, a)
+        get(client, b)
+        get(client, a)  # a is now the most recently used
+        get(client, c)  # evicts b
+        self.assertEqual(client.calls, [(a,), (b,), (c,)])
+        self.assertEqual(len(client._cache), StubClient.CACHE_SIZE)
+
+        get(client, a)
+        get(client, b)
+        self.assertEqual(client.calls, [(a,), (b,), (c,), (b,)])
+
+    def test_login_clears_cache(self):
+        client = StubClient(lambda params: {"items": []})
+        get(client)
+
+        # Tidsreg refuses the login; the previous results are gone anyway
+        response = requests.Response()
+        response.status_code = 200
+        client.session.post = lambda *args, **kwargs: response
+        self.assertEqual(client.login("user", "secret")["status"], 401)
+
+        self.assertEqual(len(client._cache), 0)
+        get(client)
+        self.assertEqual(len(client.calls), 2)
+
+
+class CoalescingTest(unittest.TestCase):
+    """Concurrent identical calls share the request of the first one."""
+
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def _blocking(self, result):
+        def answer(params):
+            self.started.set()
+            self.release.wait(5)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return answer
+
+    def _waiter(self, client):
+        """Start a second call once the first one is in flight; return its outcome holder."""
+        outcome = {}
+
+        def run():
+            try:
+                outcome["result"] = get(client)
+            except Exception as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=run)
+        self.assertTrue(self.started.wait(5))
+        thread.start()
+        # Let the waiter reach the future before the owner completes
+        time.sleep(0.2)
+        self.release.set()
+        return thread, outcome
+
+    def _owner(self, client):
+        outcome = {}
+
+        def run():
+            try:
+                outcome["result"] = get(client)
+            except Exception as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread, outcome
+
+    def _join(self, *threads):
+        for thread in threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_waiter_shares_result(self):
+        client = StubClient(self._blocking({"items": [1]}))
+        owner, owner_outcome = self._owner(client)
+        waiter, waiter_outcome = self._waiter(client)
+        self._join(owner, waiter)
+
+        self.assertEqual(owner_outcome["result"], {"items": [1]})
+        self.assertEqual(waiter_outcome["result"], {"items": [1]})
+        self.assertIsNot(owner_outcome["result"], waiter_outcome["result"])
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(client._inflight, {})
+
+    def test_waiter_gets_error_result(self):
+        error = {"error": "HTTP request failed: Bad Gateway", "status": 502}
+        client = StubClient(self._blocking(error))
+        owner, owner_outcome = self._owner(client)
+        waiter, waiter_outcome = self._waiter(client)
+        self._join(owner, waiter)
+
+        self.assertEqual(owner_outcome["result"], error)
+        self.assertEqual(waiter_outcome["result"], error)
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(len(client._cache), 0)
+        self.assertEqual(client._inflight, {})
+
+    def test_owner_raises(self):
+        client = StubClient(self._blocking(RuntimeError("boom")))
+        owner, owner_outcome = self._owner(client)
+        waiter, waiter_outcome = self._waiter(client)
+        self._join(owner, waiter)
+
+        self.assertIsInstance(owner_outcome["error"], RuntimeError)
+        self.assertIs(waiter_outcome["error"], owner_outcome["error"])
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(client._inflight, {})
+
+        # The next call starts a request of its own
+        client.answer = lambda params: {"items": []}
+        self.assertEqual(get(client), {"items": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
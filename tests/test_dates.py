@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Checks for the date helpers against the strptime versions they replaced.
+
+Run from the repository root:
+    python3 -m unittest discover tests
+"""
+
+import unittest
+from datetime import date, datetime, timedelta
+
+from tidsreg_client import _dmy_to_ymd, _week_dates, _ymd_to_dmy
+
+
+def strptime_week_dates(year, week):
+    """Previous _week_dates, built on strptime("%G-W%V-%u")."""
+    first_day = datetime.strptime(f"{year}-W{week:02d}-1", "%G-W%V-%u")
+    last_day = first_day + timedelta(days=6)
+    return {
+        "year": year,
+        "week": week,
+        "start_date": first_day.strftime("%Y-%m-%d"),
+        "end_date": last_day.strftime("%Y-%m-%d"),
+        "start_date_formatted": first_day.strftime("%d-%m-%Y"),
+        "end_date_formatted": last_day.strftime("%d-%m-%Y")
+    }
+
+
+def outcome(function, *args):
+    """Return the result of a call, or the ValueError it raised."""
+    try:
+        return function(*args)
+    except ValueError:
+        return ValueError
+
+
+# Well-formed, unpadded, impossible and malformed inputs
+YMD_INPUTS = [
+    "2025-10-13", "2024-02-29", "2025-1-5", "2025-01-5", "1000-01-01", "9999-12-31",
+    "2025-02-29", "2025-13-01", "2025-00-10", "2025-04-31", "2025-10-32",
+    "25-10-13", "2025/10/13", "2025-10-13 ", " 2025-10-13", "2025-100-1", "", "abcd-ef-gh",
+]
+DMY_INPUTS = [
+    "13-10-2025", "29-02-2024", "5-1-2025", "05-1-2025", "01-01-1000", "31-12-9999",
+    "29-02-2025", "01-13-2025", "10-00-2025", "31-04-2025", "32-10-2025",
+    "13-10-25", "13/10/2025", "13-10-2025 ", " 13-10-2025", "1-100-2025", "", "ab-cd-efgh",
+]
+
+
+class WeekDatesTest(unittest.TestCase):
+    """_week_dates gives the same weeks as strptime did, error cases included."""
+
+    def test_known_weeks(self):
+        self.assertEqual(_week_dates(2025, 42)["start_date"], "2025-10-13")
+        self.assertEqual(_week_dates(2025, 42)["end_date_formatted"], "19-10-2025")
+        # 2020 has 53 ISO weeks, whose first one starts in 2019
+        self.assertEqual(_week_dates(2020, 1)["start_date"], "2019-12-30")
+        self.assertEqual(_week_dates(2020, 53)["end_date"], "2021-01-03")
+
+    def test_matches_isocalendar(self):
+        for year in (2015, 2020, 2026):
+            weeks = date(year, 12, 28).isocalendar()[1]
+            for week in range(1, weeks + 1):
+                with self.subTest(year=year, week=week):
+                    self.assertEqual(_week_dates(year, week)["start_date"],
+                                     date.fromisocalendar(year, week, 1).isoformat())
+
+    def test_week_53_of_52_week_year(self):
+        # Rolls over into week 1 of the next year, as strptime did
+        self.assertEqual(_week_dates(2025, 53)["start_date"],
+                         date.fromisocalendar(2026, 1, 1).isoformat())
+
+    def test_invalid_weeks(self):
+        for week in (0, 54, -1):
+            with self.subTest(week=week):
+                self.assertRaises(ValueError, _week_dates, 2025, week)
+
+    def test_matches_strptime(self):
+        for year in range(1990, 2040):
+            for week in range(0, 56):
+                with self.subTest(year=year, week=week):
+                    self.assertEqual(outcome(_week_dates, year, week),
+                                     outcome(strptime_week_dates, year, week))
+
+
+class DateConversionTest(unittest.TestCase):
+    """The regex converters accept and reject what strptime did."""
+
+    def test_pairs(self):
+        self.assertEqual(_ymd_to_dmy("2025-10-13"), "13-10-2025")
+        self.assertEqual(_dmy_to_ymd("13-10-2025"), "2025-10-13")
+        self.assertEqual(_ymd_to_dmy("2025-1-5"), "05-01-2025")
+        self.assertEqual(_dmy_to_ymd("5-1-2025"), "2025-01-05")
+        # Years before 1000 keep four digits, where glibc's strftime("%Y") dropped them
+        self.assertEqual(_ymd_to_dmy("0001-01-01"), "01-01-0001")
+        self.assertEqual(_dmy_to_ymd("01-01-0001"), "0001-01-01")
+
+    def test_invalid_dates(self):
+        for value in ("2025-02-29", "2025-13-01", "13-10-2025"):
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(ValueError, "Expected YYYY-MM-DD"):
+                    _ymd_to_dmy(value)
+
+    def test_ymd_matches_strptime(self):
+        for value in YMD_INPUTS:
+            with self.subTest(value=value):
+                expected = outcome(lambda: datetime.strptime(value, "%Y-%m-%d").strftime("%d-%m-%Y"))
+                self.assertEqual(outcome(_ymd_to_dmy, value), expected)
+
+    def test_dmy_matches_strptime(self):
+        for value in DMY_INPUTS:
+            with self.subTest(value=value):
+                expected = outcome(lambda: datetime.strptime(value, "%d-%m-%Y").strftime("%Y-%m-%d"))
+                self.assertEqual(outcome(_dmy_to_ymd, value), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
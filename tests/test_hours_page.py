@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Fixture check for the Hours page parser.
+
+Run from the repository root:
+    python3 -m unittest discover tests
+"""
+
+import io
+import os
+import unittest
+
+import requests
+
+from tidsreg_client import TidsregClient, _HoursPageParser
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "hours_page.html")
+
+# Group headers of the outer table, shared by the inputs it contains
+CONTEXT = ["Acme A/S", "Website", "Build", "Development(Billable)", "Meetings", "SupportOn call"]
+
+EXPECTED_REGISTRATIONS = [
+    {"value": "4,50", "id": "h1", "name": "h[0]", "disabled": False, "context": CONTEXT},
+    {"value": "3,00", "id": "h2", "name": "h[1]", "disabled": False, "context": CONTEXT},
+    {"value": "1,00", "id": "m1", "name": "m[0]", "disabled": False, "context": CONTEXT},
+    # Inside the nested table, which has no group headers of its own
+    {"value": "2,00", "id": "s1", "name": "s[0]", "disabled": False, "context": []},
+    {"level": "groupLevel1", "data": ["Acme A/S", ""]},
+    {"level": "groupLevel2", "data": ["Website"]},
+    {"level": "groupLevel3", "data": ["Build"]},
+    {"level": "groupLevel4", "data": ["Development(Billable)", "", "", "", "", "", "", "", "7,50"],
+     "hours": ["4,50", "3,00", "", "", "", "", ""]},
+    {"level": "groupLevel4", "data": ["Meetings", "", "", "", "", "", "", "", "1,00"],
+     "hours": ["1,00", "", "", "", "", "", ""]},
+    # A row holding a nested table: own cells only, hours of the nested rows included
+    {"level": "groupLevel4", "data": ["SupportOn call", "2,00"], "hours": ["2,00"]},
+    # The nested row belongs to both the outer and the nested table
+    {"level": "groupLevel4", "data": ["On call", ""], "hours": ["2,00"]},
+    {"level": "groupLevel4", "data": ["On call", ""], "hours": ["2,00"]},
+]
+
+# The commented-out, <script> and <input> day totals of the page are not reported
+EXPECTED_TOTALS = {
+    "rowSum": "2,00",
+    "weekSum": "10,50",
+    "mon_total": "7,50",
+    "tue_total": "3,00",
+    "wed_total": "0",
+    "thu_total": "0",
+    "fri_total": "0",
+    "sat_total": "0",
+    "sun_total": "0",
+}
+
+
+class HoursPageTest(unittest.TestCase):
+    """Parse the saved Hours page whatever the chunk size it arrives in."""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE, "rb") as f:
+            cls.page = f.read()
+
+    def _response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response.raw = io.BytesIO(self.page)
+        return response
+
+    def test_one_byte_chunks(self):
+        parser = _HoursPageParser("utf-8")
+        for i in range(len(self.page)):
+            parser.feed(self.page[i:i + 1])
+        registrations, totals = parser.close()
+
+        self.assertEqual(registrations, EXPECTED_REGISTRATIONS)
+        self.assertEqual(totals, EXPECTED_TOTALS)
+
+    def test_streamed_response(self):
+        # _read_hours_page reads the response in 64 KiB chunks
+        registrations, totals, size, raw_html = TidsregClient._read_hours_page(self._response(), keep_raw=True)
+
+        self.assertEqual(registrations, EXPECTED_REGISTRATIONS)
+        self.assertEqual(totals, EXPECTED_TOTALS)
+        self.assertEqual(size, len(self.page))
+        self.assertEqual(raw_html, self.page.decode("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,10 +3,453 @@ Tidsreg HTTP Client
 Handles authentication and data retrieval from Tidsreg time registration system.
 """
 
+import os
+import logging
+import re
+import time
+import functools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import orjson
 import requests
-from typing import Dict, Any, Optional, Tuple, List
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.cookies import remove_cookie_by_name
+from urllib3.util.retry import Retry
+from cachecontrol import CacheControlAdapter
+from cachecontrol.cache import BaseCache
+from cachecontrol.heuristics import BaseHeuristic, datetime_to_header, expire_after
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List, Callable, Iterable
+from datetime import date as date_cls, datetime, timedelta
+from urllib.parse import urlsplit
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+
+# Same digits strptime("%Y-%m-%d") / strptime("%d-%m-%Y") accept
+_YMD_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_DMY_RE = re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})")
+
+
+def _checked_date(year: str, month: str, day: str) -> Tuple[int, int, int]:
+    """Return the date parts as integers; ValueError if the date does not exist."""
+    parts = int(year), int(month), int(day)
+    datetime(*parts)  # rejects month 13, February 30, ...
+    return parts
+
+
+# The same handful of dates (one week) come back on almost every call, so the
+# date parsing below is memoized on the input strings
+@functools.lru_cache(maxsize=1024)
+def _parse_ymd(date_str: str) -> date_cls:
+    """Parse a YYYY-MM-DD date."""
+    match = _YMD_RE.fullmatch(date_str)
+    try:
+        if not match:
+            raise ValueError(date_str)
+        return date_cls(*_checked_date(*match.groups()))
+    except ValueError as e:
+        raise ValueError(f"Invalid date format. Expected YYYY-MM-DD, got {date_str}") from e
+
+
+@functools.lru_cache(maxsize=1024)
+def _ymd_to_dmy(date_str: str) -> str:
+    """Convert YYYY-MM-DD to DD-MM-YYYY."""
+    parsed = _parse_ymd(date_str)
+    return f"{parsed.day:02d}-{parsed.month:02d}-{parsed.year:04d}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _dmy_to_ymd(date_str: str) -> str:
+    """Convert DD-MM-YYYY to YYYY-MM-DD."""
+    match = _DMY_RE.fullmatch(date_str)
+    try:
+        if not match:
+            raise ValueError(date_str)
+        day, month, year = match.groups()
+        year, month, day = _checked_date(year, month, day)
+    except ValueError as e:
+        raise ValueError(f"Invalid date format. Expected DD-MM-YYYY, got {date_str}") from e
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+@functools.lru_cache(maxsize=256)
+def _week_dates(year: int, week: int) -> Dict[str, Any]:
+    """Compute the dates of an ISO week (see TidsregClient.get_week_dates)."""
+    if not 1 <= week <= 53:
+        raise ValueError(f"Invalid week: {week}")
+
+    # Get first day of the week (Monday). Counting weeks from the first ISO
+    # Monday keeps week 53 of a 52-week year valid (it rolls over into the
+    # next year's week 1), as strptime("%G-W%V-%u") did
+    first_day = date_cls.fromisocalendar(year, 1, 1) + timedelta(weeks=week - 1)
+    # Get last day of the week (Sunday)
+    last_day = first_day + timedelta(days=6)
+
+    return {
+        "year": year,
+        "week": week,
+        "start_date": first_day.isoformat(),
+        "end_date": last_day.isoformat(),
+        "start_date_formatted": f"{first_day.day:02d}-{first_day.month:02d}-{first_day.year:04d}",
+        "end_date_formatted": f"{last_day.day:02d}-{last_day.month:02d}-{last_day.year:04d}"
+    }
+
+
+# Convert European format (4,50) to float
+_EU_DECIMAL = str.maketrans(',', '.')
+
+
+def _parse_eu_float(value: str) -> float:
+    """Parse an hours value such as "4,50"; blank or invalid values count as 0."""
+    if not value:
+        return 0.0
+    try:
+        return float(value.translate(_EU_DECIMAL))
+    except (ValueError, AttributeError):
+        return 0.0
+
+
+def _ymd_ordinal(date_str: str) -> int:
+    """Return the proleptic ordinal of a YYYY-MM-DD date without strptime."""
+    return _parse_ymd(date_str).toordinal()
+
+
+_DAY_NAMES = ("Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche")
+
+# Markers used to parse the Hours page
+_LEVELS = ('groupLevel1', 'groupLevel2', 'groupLevel3', 'groupLevel4')
+_HEADER_CLASSES = ('customer-header', 'project-header', 'phase-header', 'activity')
+_TOTAL_CLASSES = ('total', 'sum', 'Sum')
+_ROW_HOUR_INPUTS = etree.XPath(
+    ".//input[contains(concat(' ', normalize-space(@class), ' '), ' registration-hours ')]"
+)
+# Separators allowed in a numeric total, deleted before the digit check
+_NUMBER_PUNCTUATION = str.maketrans('', '', '.,-')
+
+
+@dataclass
+class ParsedRegistrations:
+    """
+    Activity rows (groupLevel4) of an Hours page, as parallel columns.
+
+    Holds only what the per-day summaries read, extracted once per page
+    rather than from the row dictionaries for every day.
+    """
+
+    activity_name: List[str] = field(default_factory=list)
+    billable: List[bool] = field(default_factory=list)
+    week_total: List[str] = field(default_factory=list)
+    hours: List[List[str]] = field(default_factory=list)
+
+    @classmethod
+    def from_registrations(cls, registrations: List[Dict[str, Any]]) -> "ParsedRegistrations":
+        """
+        Collect the activity rows that have hours.
+
+        Args:
+            registrations: Registrations parsed from an Hours page
+
+        Returns:
+            Columns of the activity rows, in page order
+        """
+        columns = cls()
+        for reg in registrations:
+            if reg.get('level') == 'groupLevel4' and 'hours' in reg and 'data' in reg:
+                data = reg['data']
+                # Extract activity name (first element in data) and clean it up
+                activity_name = data[0] if data else "Unknown"
+                columns.activity_name.append(activity_name.split('(')[0].strip())
+                columns.billable.append("(Billable)" in data[0] if data else False)
+                columns.week_total.append(data[8] if len(data) > 8 else "0")
+                columns.hours.append(reg['hours'])
+        return columns
+
+
+def _element_text(element: etree._Element) -> str:
+    """
+    Get the text of an element with every text fragment stripped.
+
+    Args:
+        element: HTML element
+
+    Returns:
+        Concatenated text content
+    """
+    # Most cells hold a single text node: read it without walking
+    if not len(element):
+        text = element.text
+        return text.strip() if text else ''
+    return ''.join(text.strip() for text in element.itertext())
+
+
+class _HoursTable:
+    """A table of #TimeRegistrations while it is being parsed."""
+
+    __slots__ = ('headers', 'levels')
+
+    def __init__(self, with_levels: bool):
+        # One [text] holder per group header cell, filled when the cell ends
+        self.headers: List[List[str]] = []
+        # Slots of the level rows found in the table, per level, in document
+        # order; None for the #TimeRegistrations element itself, whose own
+        # rows are not level rows
+        self.levels: Optional[Dict[str, List[List[Dict[str, Any]]]]] = (
+            {level_class: [] for level_class in _LEVELS} if with_levels else None
+        )
+
+
+class _HoursPageParser:
+    """
+    Extract registrations and totals from an Hours page in a single pass.
+
+    Works on the start/end events of an HTMLPullParser as the page is fed in.
+    The open rows, tables, header cells and total elements are kept on
+    stacks, so every value is read once, when its element ends. Top-level rows
+    are cleared as soon as nothing still open needs their text, which keeps
+    the document small however long the page is.
+    """
+
+    def __init__(self, encoding: str):
+        self._parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+
+        self._root: Optional[etree._Element] = None  # #TimeRegistrations while open
+        self._root_seen = False
+        # Open rows inside #TimeRegistrations, with the slots they fill
+        self._rows: List[Tuple[etree._Element, List[Tuple[str, List[Dict[str, Any]]]]]] = []
+        self._tables: List[_HoursTable] = []  # open tables inside #TimeRegistrations
+        self._row_depth = 0  # open rows anywhere in the page
+
+        # Elements whose text is read when they end: (element, holder)
+        self._open_headers: List[Tuple[etree._Element, List[str]]] = []
+        self._open_totals: List[Tuple[etree._Element, List[str]]] = []
+        self._open_day_totals: List[Tuple[etree._Element, str]] = []
+
+        self._inputs: List[Dict[str, Any]] = []
+        self._level_tables: List[_HoursTable] = []  # in document order
+        self._total_records: List[List[str]] = []  # [class, text] in document order
+        self._day_totals: Dict[str, str] = {}
+        self._day_total_ids = set()
+
+    def feed(self, data: bytes) -> None:
+        """Parse the next chunk of the page."""
+        self._parser.feed(data)
+        self._handle_events()
+
+    def close(self) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Finish parsing.
+
+        Returns:
+            Tuple of (registrations, totals)
+        """
+        self._parser.close()
+        self._handle_events()
+
+        # Look for registration tables - input fields first, then the rows
+        # of each table by level
+        registrations = []
+        for registration in self._inputs:
+            if 'context' in registration:
+                registration['context'] = [holder[0] for holder in registration['context']]
+            registrations.append(registration)
+        for table in self._level_tables:
+            for slots in table.levels.values():
+                for slot in slots:
+                    registrations.extend(slot)
+
+        # Look for total fields - typically have classes containing 'total' or 'sum'
+        totals = {}
+        for class_name, value in self._total_records:
+            if value and value.translate(_NUMBER_PUNCTUATION).isdigit():
+                totals[class_name] = value
+
+        # Also look for specific total containers
+        for day in ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']:
+            day_total = self._day_totals.get(f'totalHours{day.capitalize()}')
+            if day_total is not None:
+                totals[f'{day}_total'] = day_total
+
+        return registrations, totals
+
+    def _handle_events(self) -> None:
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                self._start(element)
+            else:
+                self._end(element)
+
+    def _start(self, element: etree._Element) -> None:
+        tag = element.tag
+        class_name = element.get('class', '')
+        element_id = element.get('id')
+
+        # Every registration lives under the first #TimeRegistrations
+        if element_id == 'TimeRegistrations' and not self._root_seen:
+            self._root = element
+            self._root_seen = True
+
+        if self._root is not None:
+            if tag == 'tr':
+                self._start_row(element, class_name)
+            elif tag == 'table':
+                table = _HoursTable(with_levels=element is not self._root)
+                self._tables.append(table)
+                if table.levels is not None:
+                    self._level_tables.append(table)
+            elif tag == 'input':
+                self._start_input(element, class_name)
+            elif tag == 'td' and any(header in class_name for header in _HEADER_CLASSES):
+                # Group header (customer, project, phase, activity) of every
+                # table it is in
+                holder = ['']
+                for table in self._tables:
+                    table.headers.append(holder)
+                self._open_headers.append((element, holder))
+
+        if tag == 'tr':
+            self._row_depth += 1
+
+        if any(total in class_name for total in _TOTAL_CLASSES):
+            record = [' '.join(class_name.split()), '']
+            self._total_records.append(record)
+            self._open_totals.append((element, record))
+
+        if element_id and element_id.startswith('totalHours') and element_id not in self._day_total_ids:
+            self._day_total_ids.add(element_id)
+            self._open_day_totals.append((element, element_id))
+
+    def _start_row(self, row: etree._Element, class_name: str) -> None:
+        # A level row belongs to every table it is nested in; its place in
+        # them is taken now, its cells are read when it ends
+        slots = []
+        if class_name:
+            for level_class in _LEVELS:
+                if level_class in class_name:
+                    for table in self._tables:
+                        if table.levels is not None:
+                            slot = []
+                            table.levels[level_class].append(slot)
+                            slots.append((level_class, slot))
+        self._rows.append((row, slots))
+
+    def _start_input(self, element: etree._Element, class_name: str) -> None:
+        # Input fields for hours (typically named like 'registration-hours')
+        if 'registration-hours' not in class_name:
+            return
+
+        value = element.get('value', '')
+        if not value or not self._rows:  # Only inputs with a value, inside a row
+            return
+
+        # Get the customer/project/phase/activity info from the hierarchy
+        registration = {
+            'value': value,
+            'id': element.get('id', ''),
+            'name': element.get('name', ''),
+            'disabled': 'disabled' in element.attrib
+        }
+        if self._tables:
+            # Headers of the enclosing table, complete once the page is parsed
+            registration['context'] = self._tables[-1].headers
+        self._inputs.append(registration)
+
+    def _end(self, element: etree._Element) -> None:
+        tag = element.tag
+
+        if self._open_headers and self._open_headers[-1][0] is element:
+            self._open_headers.pop()[1][0] = _element_text(element)
+        if self._open_totals and self._open_totals[-1][0] is element:
+            self._open_totals.pop()[1][1] = _element_text(element)
+        if self._open_day_totals and self._open_day_totals[-1][0] is element:
+            self._day_totals[self._open_day_totals.pop()[1]] = _element_text(element)
+
+        if self._root is not None:
+            if tag == 'tr':
+                self._end_row(element, self._rows.pop()[1])
+            elif tag == 'table':
+                self._tables.pop()
+            if element is self._root:
+                self._root = None
+
+        if tag == 'tr':
+            self._row_depth -= 1
+            # Clear as you go: nested rows go with their top-level row, and
+            # nothing is cleared while an enclosing element still needs its text
+            if not (self._row_depth or self._open_headers or self._open_totals or self._open_day_totals):
+                element.clear(keep_tail=True)
+                # Rows before it were cleared the same way: drop them
+                previous = element.getprevious()
+                while previous is not None and previous.tag == 'tr':
+                    element.getparent().remove(previous)
+                    previous = element.getprevious()
+
+    def _end_row(self, row: etree._Element, slots: List[Tuple[str, List[Dict[str, Any]]]]) -> None:
+        if not slots:
+            return
+
+        # Extract text content and hours
+        # (own cells only, not those of tables nested in them)
+        cells = list(row.iterchildren('td'))
+        if not cells:
+            return
+        data = [_element_text(cell) for cell in cells]
+        # Look for input fields in this row
+        inputs = _ROW_HOUR_INPUTS(row)
+
+        for level_class, slot in slots:
+            row_data = {'level': level_class, 'data': list(data)}
+            if inputs:
+                row_data['hours'] = [inp.get('value', '') for inp in inputs]
+            slot.append(row_data)
+
+
+class _LRUCache(BaseCache):
+    """Thread-safe in-memory cache for CacheControl, holding at most maxsize responses."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.data: "OrderedDict[str, bytes]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            value = self.data.get(key)
+            if value is not None:
+                self.data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, expires: Any = None) -> None:
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            self.data.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+
+
+class _LookupExpiry(BaseHeuristic):
+    """Let CacheControl keep each lookup response for the TTL of its endpoint."""
+
+    def __init__(self, ttls: Dict[str, float]):
+        # The heuristic sees the request path only, not the full URL
+        self.ttls = {urlsplit(url).path: ttl for url, ttl in ttls.items()}
+
+    def update_headers(self, response: Any) -> Dict[str, str]:
+        ttl = self.ttls.get(urlsplit(response.geturl() or "").path)
+        if ttl is None:
+            return {}
+        expires = expire_after(timedelta(seconds=ttl))
+        return {"expires": datetime_to_header(expires), "cache-control": "public"}
 
 
 class TidsregClient:
@@ -14,10 +457,104 @@ class TidsregClient:
 
     BASE_URL = "https://tidsreg.trifork.com"
 
-    def __init__(self):
-        """Initialize the client with a persistent session."""
+    # Endpoint URLs and the query parameter shared by every lookup, built once
+    _URL_LOGIN = BASE_URL + "/Login?ReturnUrl=/"
+    _URL_HOURS = BASE_URL + "/Hours/"
+    _URL_FIND = BASE_URL + "/Find/"
+    _URL_CUSTOMERS = _URL_FIND + "SelectCustomers"
+    _URL_PROJECTS = _URL_FIND + "SelectProjects"
+    _URL_PHASES = _URL_FIND + "SelectPhases"
+    _URL_ACTIVITIES = _URL_FIND + "SelectActivities"
+    _URL_KINDS = _URL_FIND + "SelectKinds"
+    _MODE0 = (("mode", "0"),)
+
+    # Seconds a lookup stays fresh, in both the parsed and the HTTP cache.
+    # Phases and activities change more often than customers and projects;
+    # kinds are static per project/activity.
+    _CACHE_TTLS = {
+        _URL_CUSTOMERS: 300,
+        _URL_PROJECTS: 300,
+        _URL_PHASES: 60,
+        _URL_ACTIVITIES: 60,
+        _URL_KINDS: 3600
+    }
+
+    # (connect, read) timeouts in seconds; requests has no default and would
+    # otherwise wait forever on a stalled connection
+    TIMEOUT = (5.0, 10.0)
+
+    # Most list_* results (and HTTP responses) kept in memory; the least
+    # recently used go first
+    CACHE_SIZE = 512
+
+    def __init__(self, cookie_path: Optional[str] = None):
+        """
+        Initialize the client with a persistent session.
+
+        Args:
+            cookie_path: Optional file where the session cookies are saved after
+                login and restored from on the next start, so that login can be
+                skipped while the AuthTicket is still valid
+        """
         self.session = requests.Session()
         self._authenticated = False
+        self.cookie_path = cookie_path
+
+        # Every call goes to the same host, so a few host pools are enough;
+        # keep plenty of keep-alive connections in that pool for bursts of
+        # lookups and retry transient gateway errors
+        pool_options = {
+            "pool_connections": 4,
+            "pool_maxsize": 32,
+            "max_retries": Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        }
+        self.session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "tidsreg-client/1.0",
+            "Connection": "keep-alive"
+        })
+
+        # Lookup endpoints change rarely: cache them in memory and revalidate
+        # with If-None-Match / If-Modified-Since once they expire, after the
+        # same time as their parsed results
+        self._http_cache = _LRUCache(self.CACHE_SIZE)
+        lookup_adapter = CacheControlAdapter(
+            cache=self._http_cache,
+            heuristic=_LookupExpiry(self._CACHE_TTLS),
+            **pool_options
+        )
+        self.session.mount(self._URL_FIND, lookup_adapter)
+
+        # The other pages (login, Hours) are never cached, but go through the
+        # same connection pool so that every call reuses the same keep-alive
+        # connections
+        adapter = HTTPAdapter(**pool_options)
+        adapter.poolmanager = lookup_adapter.poolmanager
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Parsed list_* results: (method, params, AuthTicket) -> (stored_at,
+        # orjson-encoded data), in least recently used order
+        self._cache: "OrderedDict[tuple, Tuple[float, bytes]]" = OrderedDict()
+
+        # Lookups currently being fetched, so concurrent identical calls share one request
+        self._inflight: Dict[tuple, Future] = {}
+        # Guards both _cache and _inflight
+        self._inflight_lock = threading.Lock()
+
+        # Cookies restored from cookie_path are only checked with Tidsreg
+        # before the first call that needs them, so that building the client
+        # never waits on the network
+        self._restore_pending = False
+        self._restore_lock = threading.Lock()
+
+        if cookie_path:
+            self._load_cookies()
 
     @staticmethod
     def _convert_date_to_hours_format(date_str: str) -> str:
@@ -30,11 +567,7 @@ class TidsregClient:
         Returns:
             Date in DD-MM-YYYY format
         """
-        try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            return date_obj.strftime("%d-%m-%Y")
-        except ValueError as e:
-            raise ValueError(f"Invalid date format. Expected YYYY-MM-DD, got {date_str}") from e
+        return _ymd_to_dmy(date_str)
 
     @staticmethod
     def _convert_date_to_api_format(date_str: str) -> str:
@@ -47,11 +580,7 @@ class TidsregClient:
         Returns:
             Date in YYYY-MM-DD format
         """
-        try:
-            date_obj = datetime.strptime(date_str, "%d-%m-%Y")
-            return date_obj.strftime("%Y-%m-%d")
-        except ValueError as e:
-            raise ValueError(f"Invalid date format. Expected DD-MM-YYYY, got {date_str}") from e
+        return _dmy_to_ymd(date_str)
 
     @staticmethod
     def get_week_dates(year: Optional[int] = None, week: Optional[int] = None) -> Dict[str, Any]:
@@ -71,20 +600,9 @@ class TidsregClient:
                 year = year or now.isocalendar()[0]
                 week = week or now.isocalendar()[1]
 
-            # Get first day of the week (Monday) using ISO week format
-            # ISO 8601: %G=year, %V=week, %u=day (1=Monday)
-            first_day = datetime.strptime(f"{year}-W{week:02d}-1", "%G-W%V-%u")
-            # Get last day of the week (Sunday)
-            last_day = first_day + timedelta(days=6)
-
-            return {
-                "year": year,
-                "week": week,
-                "start_date": first_day.strftime("%Y-%m-%d"),
-                "end_date": last_day.strftime("%Y-%m-%d"),
-                "start_date_formatted": first_day.strftime("%d-%m-%Y"),
-                "end_date_formatted": last_day.strftime("%d-%m-%Y")
-            }
+            # Resolved to a concrete week first so the cache key is stable;
+            # copied so callers can't alter the cached entry
+            return dict(_week_dates(year, week))
         except Exception as e:
             return {"error": f"Failed to calculate week dates: {str(e)}"}
 
@@ -98,17 +616,111 @@ class TidsregClient:
         Returns:
             Parsed JSON response or error dictionary
         """
-        if response.status_code != 200:
-            return {
-                "error": f"HTTP request failed: {response.reason}",
-                "status": response.status_code
-            }
+        try:
+            if response.status_code != 200:
+                return {
+                    "error": f"HTTP request failed: {response.reason}",
+                    "status": response.status_code
+                }
+
+            # Read the (streamed) body once into a single buffer and decode
+            # it from there instead of going through response.content/.json()
+            body = bytearray()
+            for chunk in response.iter_content(65536):
+                body += chunk
+        finally:
+            response.close()
 
         try:
-            return response.json()
-        except ValueError:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
             # If response is not JSON, return success indicator
-            return {"success": True, "text": response.text}
+            return {"success": True, "text": body.decode(response.encoding or "utf-8", "replace")}
+
+    def _request(self, url: str, params: Tuple[Tuple[str, str], ...], error_prefix: str) -> Dict[str, Any]:
+        """
+        GET a JSON endpoint, turning network failures into an error dictionary.
+
+        Args:
+            url: Endpoint URL
+            params: Query parameters as (name, value) pairs
+            error_prefix: Start of the error message if the request fails
+
+        Returns:
+            Parsed JSON response or error dictionary
+        """
+        try:
+            response = self.session.get(url, params=params, stream=True, timeout=self.TIMEOUT)
+            return self._handle_response(response)
+        except requests.RequestException as e:
+            return {"error": f"{error_prefix}: {str(e)}", "status": 0}
+
+    def _cached_get(self, name: str, url: str, params: Tuple[Tuple[str, str], ...],
+                    error_prefix: str) -> Dict[str, Any]:
+        """
+        GET a lookup endpoint, reusing a previous result for the same session.
+
+        Concurrent calls with the same key wait for the request already in
+        flight instead of issuing their own. Results are kept encoded and
+        every caller gets a copy of its own, so none can alter the cached
+        entry or another caller's result.
+
+        Args:
+            name: Name of the calling method, part of the cache key
+            url: Endpoint URL
+            params: Query parameters as (name, value) pairs
+            error_prefix: Start of the error message if the request fails
+
+        Returns:
+            Parsed JSON response or error dictionary
+        """
+        self._check_restored_session()
+
+        key = (name, params, self.session.cookies.get("AuthTicket"))
+        ttl = self._CACHE_TTLS[url]
+        now = time.monotonic()
+
+        with self._inflight_lock:
+            hit = self._cache.get(key)
+            if hit and now - hit[0] < ttl:
+                self._cache.move_to_end(key)
+                encoded = hit[1]
+            else:
+                if hit:
+                    del self._cache[key]
+                encoded = None
+
+                future = self._inflight.get(key)
+                owner = future is None
+                if owner:
+                    future = Future()
+                    self._inflight[key] = future
+
+        if encoded is not None:
+            return orjson.loads(encoded)
+        if not owner:
+            return orjson.loads(future.result())
+
+        try:
+            data = self._request(url, params, error_prefix)
+            encoded = orjson.dumps(data)
+
+            # Never keep errors around
+            if "error" not in data:
+                with self._inflight_lock:
+                    self._cache[key] = (now, encoded)
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self.CACHE_SIZE:
+                        self._cache.popitem(last=False)
+
+            future.set_result(encoded)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """
@@ -122,18 +734,32 @@ class TidsregClient:
             Dictionary with ok=True on success or error on failure
         """
         try:
-            url = f"{self.BASE_URL}/Login?ReturnUrl=/"
+            # Cached lookups belong to the previous session
+            self._http_cache.clear()
+            with self._inflight_lock:
+                self._cache.clear()
+
+            # Drop the ticket of the previous (or restored) session, so only
+            # one set by this login can count as success
+            remove_cookie_by_name(self.session.cookies, "AuthTicket")
+            self._authenticated = False
+            self._restore_pending = False
+
+            url = self._URL_LOGIN
             data = {
                 "userName": username,
                 "password": password
             }
 
-            response = self.session.post(url, data=data, allow_redirects=True)
+            # The AuthTicket comes with the response to the POST itself; the
+            # page it redirects to is not needed
+            response = self.session.post(url, data=data, allow_redirects=False, timeout=self.TIMEOUT)
 
-            if response.status_code == 200:
-                # Check if we got an AuthTicket cookie
-                if 'AuthTicket' in self.session.cookies:
+            if response.status_code == 200 or response.is_redirect:
+                # Check if this response set an AuthTicket cookie
+                if 'AuthTicket' in response.cookies:
                     self._authenticated = True
+                    self._save_cookies()
                     return {"ok": True}
                 else:
                     return {"error": "Authentication failed - no AuthTicket cookie received", "status": 401}
@@ -153,14 +779,20 @@ class TidsregClient:
         Returns:
             Dictionary with success status and date information
         """
+        self._check_restored_session()
+
         try:
             # Convert to Hours endpoint format (DD-MM-YYYY)
             hours_date = self._convert_date_to_hours_format(date)
-            url = f"{self.BASE_URL}/Hours/{hours_date}"
+            url = self._URL_HOURS + hours_date
 
-            response = self.session.get(url, allow_redirects=True)
+            # Only the server-side state matters, so redirects are not followed
+            response = self.session.get(url, allow_redirects=False, timeout=self.TIMEOUT)
 
-            if response.status_code == 200:
+            if self._is_login_redirect(response):
+                return {"error": "Navigation failed: session expired, login required", "status": 401}
+
+            if 200 <= response.status_code < 400:
                 return {
                     "ok": True,
                     "date": date,
@@ -220,19 +852,14 @@ class TidsregClient:
         Returns:
             List of customer objects or error dictionary
         """
-        try:
-            url = f"{self.BASE_URL}/Find/SelectCustomers"
-            params = {"mode": "0"}
-
-            # Add date parameter if provided (matches navigation behavior)
-            if date:
-                params["date"] = date
+        params = self._MODE0
 
-            response = self.session.get(url, params=params)
-            return self._handle_response(response)
+        # Add date parameter if provided (matches navigation behavior)
+        if date:
+            params += (("date", date),)
 
-        except Exception as e:
-            return {"error": f"Failed to fetch customers: {str(e)}", "status": 0}
+        return self._cached_get("list_customers", self._URL_CUSTOMERS, params,
+                                error_prefix="Failed to fetch customers")
 
     def list_projects(self, customerId: str, date: str) -> Dict[str, Any]:
         """
@@ -245,19 +872,10 @@ class TidsregClient:
         Returns:
             List of project objects or error dictionary
         """
-        try:
-            url = f"{self.BASE_URL}/Find/SelectProjects"
-            params = {
-                "mode": "0",
-                "date": date,
-                "customerId": customerId
-            }
+        params = self._MODE0 + (("date", date), ("customerId", customerId))
 
-            response = self.session.get(url, params=params)
-            return self._handle_response(response)
-
-        except Exception as e:
-            return {"error": f"Failed to fetch projects: {str(e)}", "status": 0}
+        return self._cached_get("list_projects", self._URL_PROJECTS, params,
+                                error_prefix="Failed to fetch projects")
 
     def list_phases(self, projectId: str, date: str) -> Dict[str, Any]:
         """
@@ -270,19 +888,104 @@ class TidsregClient:
         Returns:
             List of phase objects or error dictionary
         """
+        params = self._MODE0 + (("date", date), ("projectId", projectId))
+
+        return self._cached_get("list_phases", self._URL_PHASES, params,
+                                error_prefix="Failed to fetch phases")
+
+    def _fetch_many(self, method: Callable[[str, str], Dict[str, Any]], ids: Iterable[str],
+                    date: str) -> Dict[str, Any]:
+        """
+        Call a lookup method for several IDs concurrently.
+
+        Args:
+            method: Bound lookup method taking an ID and a date
+            ids: IDs to look up
+            date: Date in format YYYY-MM-DD
+
+        Returns:
+            Dictionary of lookup results keyed by ID
+        """
+        ids = list(dict.fromkeys(ids))
+        if len(ids) <= 1:
+            return {item_id: method(item_id, date) for item_id in ids}
+
+        # The lookups share the session's keep-alive pool, so the batch costs
+        # about one round trip instead of one per ID
+        with ThreadPoolExecutor(max_workers=min(8, len(ids))) as executor:
+            futures = {item_id: executor.submit(method, item_id, date) for item_id in ids}
+            return {item_id: future.result() for item_id, future in futures.items()}
+
+    def list_projects_many(self, customer_ids: Iterable[str], date: str) -> Dict[str, Any]:
+        """
+        Retrieve the projects of several customers concurrently.
+
+        Args:
+            customer_ids: The customer IDs
+            date: Date in format YYYY-MM-DD
+
+        Returns:
+            Dictionary of project lists (or error dictionaries) keyed by customer ID
+        """
+        return self._fetch_many(self.list_projects, customer_ids, date)
+
+    def list_phases_many(self, project_ids: Iterable[str], date: str) -> Dict[str, Any]:
+        """
+        Retrieve the phases of several projects concurrently.
+
+        Args:
+            project_ids: The project IDs
+            date: Date in format YYYY-MM-DD
+
+        Returns:
+            Dictionary of phase lists (or error dictionaries) keyed by project ID
+        """
+        return self._fetch_many(self.list_phases, project_ids, date)
+
+    def prefetch_project(self, customerId: str, date: str) -> Dict[str, Any]:
+        """
+        Retrieve the projects of a customer together with the phases of each project.
+
+        The phase lookups are independent of each other, so they are issued
+        concurrently rather than one round trip at a time.
+
+        Args:
+            customerId: The customer ID
+            date: Date in format YYYY-MM-DD
+
+        Returns:
+            Dictionary with projects and phases (keyed by project ID) or error dictionary
+        """
         try:
-            url = f"{self.BASE_URL}/Find/SelectPhases"
-            params = {
-                "mode": "0",
-                "date": date,
-                "projectId": projectId
-            }
+            projects = self.list_projects(customerId, date)
+
+            if "error" in projects:
+                return projects
+
+            # SelectProjects answers with a JSON array of {"id", "name"}
+            # objects (as documented in the README and openapi.yaml); an
+            # {"items": [...]} envelope is accepted too. Anything else is an
+            # error rather than an empty phase map.
+            items = projects.get("items") if isinstance(projects, dict) else projects
+            if not isinstance(items, list) or not all(
+                isinstance(project, dict) and "id" in project for project in items
+            ):
+                return {
+                    "error": "Unexpected project list from Tidsreg: expected a list of objects with an id",
+                    "status": 502
+                }
 
-            response = self.session.get(url, params=params)
-            return self._handle_response(response)
+            project_ids = [str(project["id"]) for project in items]
+
+            phases = self.list_phases_many(project_ids, date)
+
+            return {
+                "projects": projects,
+                "phases": phases
+            }
 
         except Exception as e:
-            return {"error": f"Failed to fetch phases: {str(e)}", "status": 0}
+            return {"error": f"Failed to prefetch project: {str(e)}", "status": 0}
 
     def list_activities(self, phaseId: str, date: str) -> Dict[str, Any]:
         """
@@ -295,19 +998,23 @@ class TidsregClient:
         Returns:
             List of activity objects or error dictionary
         """
-        try:
-            url = f"{self.BASE_URL}/Find/SelectActivities"
-            params = {
-                "mode": "0",
-                "date": date,
-                "phaseId": phaseId
-            }
+        params = self._MODE0 + (("date", date), ("phaseId", phaseId))
 
-            response = self.session.get(url, params=params)
-            return self._handle_response(response)
+        return self._cached_get("list_activities", self._URL_ACTIVITIES, params,
+                                error_prefix="Failed to fetch activities")
 
-        except Exception as e:
-            return {"error": f"Failed to fetch activities: {str(e)}", "status": 0}
+    def list_activities_many(self, phase_ids: Iterable[str], date: str) -> Dict[str, Any]:
+        """
+        Retrieve the activities of several phases concurrently.
+
+        Args:
+            phase_ids: The phase IDs
+            date: Date in format YYYY-MM-DD
+
+        Returns:
+            Dictionary of activity lists (or error dictionaries) keyed by phase ID
+        """
+        return self._fetch_many(self.list_activities, phase_ids, date)
 
     def list_kinds(self, projectName: str, activityName: str) -> Dict[str, Any]:
         """
@@ -320,19 +1027,10 @@ class TidsregClient:
         Returns:
             List of kind objects or error dictionary
         """
-        try:
-            url = f"{self.BASE_URL}/Find/SelectKinds"
-            params = {
-                "mode": "0",
-                "projectName": projectName,
-                "activityName": activityName
-            }
+        params = self._MODE0 + (("projectName", projectName), ("activityName", activityName))
 
-            response = self.session.get(url, params=params)
-            return self._handle_response(response)
-
-        except Exception as e:
-            return {"error": f"Failed to fetch kinds: {str(e)}", "status": 0}
+        return self._cached_get("list_kinds", self._URL_KINDS, params,
+                                error_prefix="Failed to fetch kinds")
 
     def _get_day_index_for_date(self, date: str, week_start_date: str) -> int:
         """
@@ -346,19 +1044,18 @@ class TidsregClient:
             Day index (0=Monday, 6=Sunday)
         """
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            week_start_obj = datetime.strptime(week_start_date, "%Y-%m-%d")
-            delta = (date_obj - week_start_obj).days
+            delta = _ymd_ordinal(date) - _ymd_ordinal(week_start_date)
             return delta if 0 <= delta <= 6 else 0
         except:
             return 0
 
-    def get_registered_hours(self, date: str) -> Dict[str, Any]:
+    def get_registered_hours(self, date: str, include_raw: bool = False) -> Dict[str, Any]:
         """
         Retrieve registered hours for a specific date/week.
 
         Args:
             date: Date in YYYY-MM-DD format
+            include_raw: Also return the downloaded page under "_raw_html"
 
         Returns:
             Dictionary with registered hours data including:
@@ -369,87 +1066,89 @@ class TidsregClient:
         try:
             # Convert to Hours endpoint format (DD-MM-YYYY)
             hours_date = self._convert_date_to_hours_format(date)
-            url = f"{self.BASE_URL}/Hours/{hours_date}"
 
-            response = self.session.get(url, allow_redirects=True)
+            page = self._fetch_hours_page(hours_date, include_raw)
+            if "error" in page:
+                return page
 
-            if response.status_code != 200:
-                return {
-                    "error": f"Failed to fetch hours: {response.reason}",
-                    "status": response.status_code
-                }
+            # Get week information; the ISO weekday is also the day's
+            # position in the week (Monday=1)
+            year, week, weekday = _parse_ymd(date).isocalendar()
+            week_info = self.get_week_dates(year, week)
+
+            day = self._summarize_day(weekday - 1, page["activities"])
+
+            result = {
+                "ok": True,
+                "date": date,
+                "date_formatted": hours_date,
+                "day_name": day["day_name"],
+                "day_index": day["day_index"],
+                "week_info": week_info,
+                "hours_for_day": day["hours_for_day"],
+                "total_hours_for_day": day["total_hours_for_day"],
+                "warnings": day["warnings"],
+                "registrations": page["registrations"],
+                "totals": page["totals"],
+                "raw_html_size": page["raw_html_size"]
+            }
+
+            if include_raw:
+                result["_raw_html"] = page["raw_html"]
+
+            return result
+
+        except ValueError as e:
+            return {"error": str(e), "status": 0}
+        except Exception as e:
+            return {"error": f"Failed to retrieve hours: {str(e)}", "status": 0}
 
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'lxml')
+    def get_registered_hours_week(self, date: str) -> Dict[str, Any]:
+        """
+        Retrieve registered hours for every day of the week containing a date.
 
-            # Extract registrations data
-            registrations = self._parse_registrations(soup)
+        The Hours page of any date holds the whole week, so it is downloaded
+        and parsed once rather than once per day.
 
-            # Extract totals
-            totals = self._parse_totals(soup)
+        Args:
+            date: Any date of the week in YYYY-MM-DD format
+
+        Returns:
+            Dictionary with week_info, the per-day summaries under "days"
+            (same fields as get_registered_hours for a single day), the week
+            total, registrations and totals, or error dictionary
+        """
+        try:
+            # Convert to Hours endpoint format (DD-MM-YYYY)
+            hours_date = self._convert_date_to_hours_format(date)
+
+            page = self._fetch_hours_page(hours_date)
+            if "error" in page:
+                return page
 
             # Get week information
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            year, week, _ = date_obj.isocalendar()
+            year, week, _ = _parse_ymd(date).isocalendar()
             week_info = self.get_week_dates(year, week)
 
-            # Get day index for the requested date
-            day_index = self._get_day_index_for_date(date, week_info["start_date"])
-
-            # Extract hours for the specific day
-            day_entries = []
-            day_names = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
-
-            for reg in registrations:
-                if reg.get('level') == 'groupLevel4' and 'hours' in reg and 'data' in reg:
-                    hours_list = reg['hours']
-                    if len(hours_list) > day_index and hours_list[day_index]:
-                        # Extract activity name (first element in data)
-                        activity_name = reg['data'][0] if reg['data'] else "Unknown"
-                        # Clean up the name
-                        activity_name = activity_name.split('(')[0].strip()
-
-                        day_entries.append({
-                            "activity": activity_name,
-                            "hours": hours_list[day_index],
-                            "billable": "(Billable)" in reg['data'][0] if reg['data'] else False,
-                            "week_total": reg['data'][8] if len(reg['data']) > 8 else "0",
-                            "hours_all_days": hours_list
-                        })
-
-            # Calculate total hours for the day and check if suspicious
-            total_hours = 0.0
-            for entry in day_entries:
-                try:
-                    # Convert European format (4,50) to float
-                    hours_str = entry['hours'].replace(',', '.')
-                    total_hours += float(hours_str)
-                except (ValueError, AttributeError):
-                    pass
-
-            # Check if day is suspicious (weekday with < 7.5 hours)
-            warnings = []
-            is_weekday = day_index < 5  # Monday=0 to Friday=4
-            if is_weekday and total_hours < 7.5 and total_hours > 0:
-                warnings.append({
-                    "type": "suspicious_hours",
-                    "message": f"⚠️ Seulement {total_hours:.2f}h enregistrées pour un jour de semaine ({day_names[day_index]})",
-                    "suggestion": "Vérifier si toutes les heures ont bien été enregistrées"
+            first_day = date_cls.fromisoformat(week_info["start_date"])
+            days = []
+            for offset in range(7):
+                day_date = (first_day + timedelta(days=offset)).isoformat()
+                days.append({
+                    "date": day_date,
+                    "date_formatted": self._convert_date_to_hours_format(day_date),
+                    **self._summarize_day(offset, page["activities"])
                 })
 
             return {
                 "ok": True,
-                "date": date,
-                "date_formatted": hours_date,
-                "day_name": day_names[day_index] if day_index < 7 else "Unknown",
-                "day_index": day_index,
                 "week_info": week_info,
-                "hours_for_day": day_entries,
-                "total_hours_for_day": total_hours,
-                "warnings": warnings,
-                "registrations": registrations,
-                "totals": totals,
-                "raw_html_size": len(response.text)
+                "days": days,
+                "total_hours_for_week": sum(day["total_hours_for_day"] for day in days),
+                "warnings": [warning for day in days for warning in day["warnings"]],
+                "registrations": page["registrations"],
+                "totals": page["totals"],
+                "raw_html_size": page["raw_html_size"]
             }
 
         except ValueError as e:
@@ -457,112 +1156,259 @@ class TidsregClient:
         except Exception as e:
             return {"error": f"Failed to retrieve hours: {str(e)}", "status": 0}
 
-    def _parse_registrations(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _fetch_hours_page(self, hours_date: str, include_raw: bool = False) -> Dict[str, Any]:
         """
-        Parse time registrations from HTML.
+        Download and parse the Hours page of a date.
 
         Args:
-            soup: BeautifulSoup object of the page
+            hours_date: Date in DD-MM-YYYY format
+            include_raw: Also return the page text under "raw_html"
 
         Returns:
-            List of registration dictionaries
+            Dictionary with registrations, their activity columns
+            (ParsedRegistrations), totals, raw_html_size (and raw_html) or
+            error dictionary
         """
-        registrations = []
+        self._check_restored_session()
 
-        try:
-            # Look for registration tables - typically have classes like 'groupLevel*'
-            # Find all input fields for hours (typically named like 'registration-hours')
-            hour_inputs = soup.find_all('input', {'class': lambda x: x and 'registration-hours' in x})
-
-            # Find all registration rows
-            for input_field in hour_inputs:
-                # Try to extract registration info from the row
-                row = input_field.find_parent('tr')
-                if not row:
-                    continue
-
-                # Get the customer/project/phase/activity info from the hierarchy
-                registration = {
-                    'value': input_field.get('value', ''),
-                    'id': input_field.get('id', ''),
-                    'name': input_field.get('name', ''),
-                    'disabled': input_field.has_attr('disabled')
+        url = self._URL_HOURS + hours_date
+
+        with self.session.get(url, allow_redirects=True, stream=True, timeout=self.TIMEOUT) as response:
+            if response.status_code != 200:
+                return {
+                    "error": f"Failed to fetch hours: {response.reason}",
+                    "status": response.status_code
                 }
 
-                # Try to find associated labels or headers
-                parent_table = input_field.find_parent('table')
-                if parent_table:
-                    # Look for group headers (customer, project, phase, activity)
-                    headers = parent_table.find_all('td', {'class': lambda x: x and any(h in str(x) for h in ['customer-header', 'project-header', 'phase-header', 'activity'])})
-                    registration['context'] = [h.get_text(strip=True) for h in headers]
-
-                if registration['value']:  # Only include if there's a value
-                    registrations.append(registration)
-
-            # Also look for existing registrations in a more structured way
-            time_registrations = soup.find(id='TimeRegistrations')
-            if time_registrations:
-                # Find all tables with registration data
-                for table in time_registrations.find_all('table'):
-                    # Extract customer/project/phase/activity hierarchy
-                    for level_class in ['groupLevel1', 'groupLevel2', 'groupLevel3', 'groupLevel4']:
-                        level_rows = table.find_all('tr', {'class': lambda x: x and level_class in str(x)})
-                        for row in level_rows:
-                            # Extract text content and hours
-                            cells = row.find_all('td')
-                            if cells:
-                                row_data = {
-                                    'level': level_class,
-                                    'data': [cell.get_text(strip=True) for cell in cells]
-                                }
-                                # Look for input fields in this row
-                                inputs = row.find_all('input', {'class': 'registration-hours'})
-                                if inputs:
-                                    row_data['hours'] = [inp.get('value', '') for inp in inputs]
-
-                                if row_data['data']:  # Only add if there's content
-                                    registrations.append(row_data)
+            registrations, totals, html_size, raw_html = self._read_hours_page(response, keep_raw=include_raw)
 
-        except Exception as e:
-            registrations.append({"error": f"Error parsing registrations: {str(e)}"})
+        return {
+            "registrations": registrations,
+            "activities": ParsedRegistrations.from_registrations(registrations),
+            "totals": totals,
+            "raw_html_size": html_size,
+            "raw_html": raw_html
+        }
 
-        return registrations
+    def _summarize_day(self, day_index: int, activities: ParsedRegistrations) -> Dict[str, Any]:
+        """
+        Extract the hours of one day from the activity rows of its week.
+
+        Args:
+            day_index: Position of the day in the week (0=Monday, 6=Sunday)
+            activities: Activity rows parsed from the week's Hours page
 
-    def _parse_totals(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        Returns:
+            Dictionary with day_name, day_index, hours_for_day,
+            total_hours_for_day and warnings
         """
-        Parse totals from HTML.
+        # Extract hours for the specific day
+        day_entries = []
+
+        rows = zip(activities.activity_name, activities.billable, activities.week_total, activities.hours)
+        for activity_name, billable, week_total, hours_list in rows:
+            if len(hours_list) > day_index and hours_list[day_index]:
+                day_entries.append({
+                    "activity": activity_name,
+                    "hours": hours_list[day_index],
+                    "billable": billable,
+                    "week_total": week_total,
+                    "hours_all_days": hours_list
+                })
+
+        # Calculate total hours for the day and check if suspicious
+        total_hours = sum((_parse_eu_float(entry['hours']) for entry in day_entries), 0.0)
+
+        # Check if day is suspicious (weekday with < 7.5 hours)
+        warnings = []
+        is_weekday = day_index < 5  # Monday=0 to Friday=4
+        if is_weekday and total_hours < 7.5 and total_hours > 0:
+            warnings.append({
+                "type": "suspicious_hours",
+                "message": f"⚠️ Seulement {total_hours:.2f}h enregistrées pour un jour de semaine ({_DAY_NAMES[day_index]})",
+                "suggestion": "Vérifier si toutes les heures ont bien été enregistrées"
+            })
+
+        return {
+            "day_name": _DAY_NAMES[day_index] if day_index < 7 else "Unknown",
+            "day_index": day_index,
+            "hours_for_day": day_entries,
+            "total_hours_for_day": total_hours,
+            "warnings": warnings
+        }
+
+    @staticmethod
+    def _read_hours_page(response: requests.Response, keep_raw: bool = False
+                         ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int, Optional[str]]:
+        """
+        Parse a streamed Hours page while it downloads.
 
         Args:
-            soup: BeautifulSoup object of the page
+            response: Response opened with stream=True
+            keep_raw: Also return the page as text
 
         Returns:
-            Dictionary with totals information
+            Tuple of (registrations, totals, body size in bytes, page text or None)
         """
-        totals = {}
+        # libxml2 decodes the bytes itself with the charset announced by the
+        # server, like response.text would
+        encoding = response.encoding or "utf-8"
+        parser = _HoursPageParser(encoding)
+
+        size = 0
+        chunks = [] if keep_raw else None
+        for chunk in response.iter_content(65536):
+            size += len(chunk)
+            parser.feed(chunk)
+            if chunks is not None:
+                chunks.append(chunk)
+
+        registrations, totals = parser.close()
+        raw_html = b"".join(chunks).decode(encoding, "replace") if chunks is not None else None
+        return registrations, totals, size, raw_html
+
+    def get_auth_ticket(self) -> Optional[str]:
+        """Return the AuthTicket cookie of the current session, if any."""
+        return self.session.cookies.get("AuthTicket")
+
+    def use_auth_ticket(self, auth_ticket: str) -> bool:
+        """
+        Resume an existing Tidsreg session from its AuthTicket cookie.
+
+        The ticket is only trusted once Tidsreg has accepted it; a rejected
+        ticket is dropped again.
 
+        Args:
+            auth_ticket: AuthTicket cookie value obtained from a previous login
+
+        Returns:
+            True if Tidsreg accepted the ticket
+        """
+        # Same domain/path as the cookie set by Tidsreg, so a refreshed
+        # ticket replaces this one instead of conflicting with it
+        self.session.cookies.set(
+            "AuthTicket",
+            auth_ticket,
+            domain=urlsplit(self.BASE_URL).hostname,
+            path="/"
+        )
+        # Unknown (network error) is not good enough to vouch for a caller's ticket
+        self._authenticated = self._validate_session() is True
+        return self._authenticated
+
+    def _load_cookies(self) -> None:
+        """
+        Restore the cookies saved by a previous login.
+
+        The AuthTicket is trusted for now; _check_restored_session() asks
+        Tidsreg whether it is still valid before it is first used.
+        """
         try:
-            # Look for total fields - typically have classes containing 'total' or 'sum'
-            total_elements = soup.find_all(class_=lambda x: x and any(t in str(x) for t in ['total', 'sum', 'Sum']))
+            with open(self.cookie_path, 'rb') as f:
+                cookies = orjson.loads(f.read())
+            for cookie in cookies:
+                self.session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                    expires=cookie.get("expires"),
+                    secure=cookie.get("secure", False)
+                )
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning("Ignoring unreadable cookie file %s: %s", self.cookie_path, e)
+            return
+
+        if 'AuthTicket' in self.session.cookies:
+            self._authenticated = True
+            self._restore_pending = True
+
+    def _check_restored_session(self) -> None:
+        """
+        Validate the cookies restored by _load_cookies(), once.
 
-            for element in total_elements:
-                # Extract the total value
-                value = element.get_text(strip=True)
-                class_name = ' '.join(element.get('class', []))
+        A ticket that Tidsreg dropped or refreshed meanwhile is saved back to
+        cookie_path, so the next start does not restore a stale one.
+        """
+        if not self._restore_pending:
+            return
+
+        with self._restore_lock:
+            if not self._restore_pending:
+                return
+            self._restore_pending = False
+
+            ticket = self.get_auth_ticket()
+            self._validate_session()
+            if self.get_auth_ticket() != ticket:
+                self._save_cookies()
+
+    def _save_cookies(self) -> None:
+        """Save the session cookies to cookie_path (readable by the owner only)."""
+        if not self.cookie_path:
+            return
+
+        cookies = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+                "secure": cookie.secure
+            }
+            for cookie in self.session.cookies
+        ]
+        try:
+            fd = os.open(self.cookie_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(cookies))
+        except OSError as e:
+            logger.warning("Could not save cookies to %s: %s", self.cookie_path, e)
 
-                if value and value.replace('.', '').replace(',', '').replace('-', '').isdigit():
-                    totals[class_name] = value
+    @staticmethod
+    def _is_login_redirect(response: requests.Response) -> bool:
+        """Check whether Tidsreg answered by sending the client to its login page."""
+        return response.is_redirect and "login" in response.headers.get("Location", "").lower()
 
-            # Also look for specific total containers
-            for day in ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']:
-                day_total = soup.find(id=f'totalHours{day.capitalize()}')
-                if day_total:
-                    totals[f'{day}_total'] = day_total.get_text(strip=True)
+    def _validate_session(self) -> Optional[bool]:
+        """
+        Check with a cheap HEAD request that the AuthTicket is still accepted.
 
-        except Exception as e:
-            totals['error'] = f"Error parsing totals: {str(e)}"
+        An expired ticket is answered with a 401 or a redirect to the login
+        page; the cookies are then dropped so that login() is required again.
+        Only a successful (2xx) page counts as accepted. Any other answer, or
+        a network error, proves nothing and leaves the session as it is.
 
-        return totals
+        Returns:
+            True if Tidsreg accepted the session, False if it rejected it,
+            None if that could not be told
+        """
+        try:
+            response = self.session.head(self.BASE_URL + "/", allow_redirects=False, timeout=self.TIMEOUT)
+            # Follow other redirects (e.g. to the Hours page) one hop at a
+            # time, stopping at the first one that leads to the login page
+            hops = self.session.resolve_redirects(response, response.request, timeout=self.TIMEOUT)
+            while response.is_redirect and not self._is_login_redirect(response):
+                response = next(hops)
+        except requests.RequestException as e:
+            logger.warning("Could not validate the session: %s", e)
+            return None
+
+        if response.status_code == 401 or self._is_login_redirect(response):
+            self.session.cookies.clear()
+            self._authenticated = False
+            return False
+
+        if not 200 <= response.status_code < 300:
+            logger.warning("Could not validate the session: HTTP %s", response.status_code)
+            return None
+
+        return True
 
     def is_authenticated(self) -> bool:
         """Check if the client is authenticated."""
+        self._check_restored_session()
         return self._authenticated
@@ -0,0 +1,10 @@
+"""
+WSGI entrypoint for running the Tidsreg HTTP server under gevent workers.
+Patches the standard library before requests/urllib3 are imported so that
+upstream Tidsreg calls yield to other greenlets while waiting on sockets.
+"""
+
+from gevent import monkey
+monkey.patch_all()
+
+from http_server import app  # noqa: E402